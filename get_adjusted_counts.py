@@ -17,7 +17,10 @@ def run():
     score_generator.retry_missed_authors(all_school_scores)
 
     # adds the author count key to all_school_scores
-    score_generator.add_author_count(all_school_scores)
+    final_school_scores = score_generator.add_author_count(all_school_scores)
+
+    # builds the institution x area x year score tensor used for re-ranking by year range and area
+    score_generator.write_score_tensor(final_school_scores)
 
     end_time = time.time()
     score_generator.log_total_time_taken(start_time, end_time)
@@ -0,0 +1,14 @@
+import logging
+from services.score_generator import score_generator
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run():
+    # logs the estimated requests and time per institution, largest first, without calling DBLP
+    score_generator.plan_run()
+
+
+run()
@@ -0,0 +1,28 @@
+import argparse
+import logging
+from services.ranking_service import create_server
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Serve rankings from the newest all-school-scores-final-<date>.json file.")
+    parser.add_argument("--directory", default=".", help="directory containing the final scores files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = create_server(args.directory, host=args.host, port=args.port)
+    logger.info(f"Serving rankings from {args.directory} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.ranking_service.repository.stop()
+        server.server_close()
+
+
+run()
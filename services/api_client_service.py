@@ -4,6 +4,7 @@ from urllib.parse import quote
 from retrying import retry
 import requests
 from services.api_json_keys import api_keys
+from services.hit_stream_parser import hit_stream_parser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +28,9 @@ class APIClient:
         self.backoff_time_in_ms = 180000
         self.backoff_time_in_seconds = 180
         self.min_page_count = 12
+        # the h= page size sent with every search
+        self.max_hits_per_request = 1000
+        self.hit_counts = {}
         self.missed_authors = set()
         self.retry_interval_seconds = 600
 
@@ -41,13 +45,31 @@ class APIClient:
 
     @retry(stop_max_attempt_number=5, wait_fixed=backoff_time_in_ms, retry_on_exception=retry_if_429_error)
     def send_get_request(self, api_url: str, school, author) -> dict | None:
+        return self.request_and_parse(api_url, school, author, lambda response: response.json(), error_result={})
+
+    @retry(stop_max_attempt_number=5, wait_fixed=backoff_time_in_ms, retry_on_exception=retry_if_429_error)
+    def send_streaming_get_request(self, api_url: str, school, author, record_missed=True) -> tuple | None:
+        """
+        Streams a publication search response through the incremental parser and returns the number
+        of hits, DBLP's total for the query and the hit records whose venue maps to an area.
+        """
+        return self.request_and_parse(api_url, school, author, self.parse_hit_stream, stream=True,
+                                      record_missed=record_missed)
+
+    @staticmethod
+    def parse_hit_stream(response) -> tuple:
+        response.raw.decode_content = True
+        return hit_stream_parser.parse(response.raw)
+
+    def request_and_parse(self, api_url: str, school, author, parse_response, stream=False, error_result=None,
+                          record_missed=True):
         try:
             time.sleep(1)
-            response = requests.get(api_url)
-            response.raise_for_status()
+            with requests.get(api_url, stream=stream) as response:
+                response.raise_for_status()
 
-            if response.status_code == 200:
-                return response.json()
+                if response.status_code == 200:
+                    return parse_response(response)
 
         except requests.exceptions.RequestException as e:
             if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
@@ -55,12 +77,14 @@ class APIClient:
                     logger.info(f"Too Many Requests, retrying after {self.backoff_time_in_seconds} seconds.")
                 elif e.response.status_code == 500:
                     logger.error(f"Internal Server Error (500) occurred for URL: {api_url}")
-                    self.missed_authors.add(f"{school.replace(' ', '-')} {author.replace(' ', '-')}")
-                    return {}
+                    if record_missed:
+                        self.missed_authors.add(f"{school.replace(' ', '-')} {author.replace(' ', '-')}")
+                    return error_result
                 elif e.response.status_code == 413:
                     logger.error(f"Payload Too Large! {e}")
-                    self.missed_authors.add(f"{school.replace(' ', '-')} {author.replace(' ', '-')}")
-                    return {}
+                    if record_missed:
+                        self.missed_authors.add(f"{school.replace(' ', '-')} {author.replace(' ', '-')}")
+                    return error_result
                 else:
                     logger.error(f"Error occurred during the request: {str(e)}")
             else:
@@ -72,15 +96,17 @@ class APIClient:
             raise
 
     def author_has_less_than_1001_hits(self, url: str, school: str, author: str) -> tuple:
-        json_data = self.send_get_request(url, school, author)
+        parsed_hits = self.send_streaming_get_request(url, school, author)
         result = None
-        if json_data:
-            hits = json_data[api_keys.RESULT][api_keys.HITS]
-            hit_key_value = hits.get(api_keys.HIT, [])
-            if len(hit_key_value) < 1001:
+        hit_records = None
+        if parsed_hits:
+            hit_count, hit_total, hit_records = parsed_hits
+            # the total is cached for the run planner only; scoring still goes by the hits returned
+            self.hit_counts[author] = hit_total
+            if hit_count < 1001:
                 result = True
 
-        return result, json_data
+        return result, hit_records
 
     def generate_author_search_api_url(self, author: str) -> str:
         base_url = "https://dblp.dagstuhl.de/search/author/api"
@@ -1,12 +1,15 @@
 class APIKeys:
     RESULT = "result"
     HITS = "hits"
+    TOTAL = "@total"
     HIT = "hit"
     INFO = "info"
     URL = "url"
     YEAR = "year"
     VENUE = "venue"
     PAGES = "pages"
+    AUTHORS = "authors"
+    AUTHOR = "author"
 
 
 api_keys = APIKeys()
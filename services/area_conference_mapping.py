@@ -85,6 +85,12 @@ class CategorizeVenue:
             ]
         }
 
+        # the first area listing a conference wins, as in a scan of area_to_conference_map in order
+        self.conference_to_area = {}
+        for area, confs in self.area_to_conference_map.items():
+            for conf in confs:
+                self.conference_to_area.setdefault(conf.casefold(), area)
+
     def categorize_venue(self, venue: str) -> str | None:
         if not venue:
             return None
@@ -93,12 +99,7 @@ class CategorizeVenue:
         if isinstance(venue, list):
             venue = ', '.join(venue)
 
-        for area, confs in self.area_to_conference_map.items():
-            for conf in confs:
-                if venue.casefold() == conf.casefold():
-                    return area
-
-        return None
+        return self.conference_to_area.get(venue.casefold())
 
 
 categorize_venue = CategorizeVenue()
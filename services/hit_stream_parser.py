@@ -0,0 +1,95 @@
+import io
+import logging
+import ijson
+
+from services.area_conference_mapping import categorize_venue
+from services.api_json_keys import api_keys
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class HitRecord:
+    __slots__ = ("venue", "area", "pages", "year", "author_count")
+
+    def __init__(self, venue=None, area=None, pages="1", year=0, author_count=0):
+        self.venue = venue
+        self.area = area
+        self.pages = pages
+        self.year = year
+        self.author_count = author_count
+
+
+class HeadRecordingStream:
+    """
+    File-like wrapper that keeps the first chunk read from the wrapped stream.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.head = b""
+
+    def read(self, size=-1) -> bytes:
+        chunk = self.stream.read(size)
+        if not self.head:
+            self.head = chunk
+        return chunk
+
+
+class HitStreamParser:
+    """
+    Incrementally parses a DBLP publication search response and keeps only the fields
+    needed for scoring, so only one hit is decoded at a time.
+    """
+    def __init__(self, venue_categorizer):
+        self.venue_categorizer = venue_categorizer
+        hits_prefix = f"{api_keys.RESULT}.{api_keys.HITS}"
+        self.total_prefix = f"{hits_prefix}.{api_keys.TOTAL}"
+        self.info_prefix = f"{hits_prefix}.{api_keys.HIT}.item.{api_keys.INFO}"
+
+    def parse(self, stream) -> tuple:
+        """
+        Returns the number of hits in the response, the total number of hits DBLP reports for the query
+        and the records whose venue maps to an area. The total falls back to the number of hits in the
+        response when DBLP omits it.
+        """
+        head_recording_stream = HeadRecordingStream(stream)
+        hit_count = 0
+        records = []
+        for hit_info in ijson.items(head_recording_stream, self.info_prefix):
+            hit_count += 1
+            record = self.build_record(hit_info)
+            if record.area:
+                records.append(record)
+
+        hit_total = self.read_hit_total(head_recording_stream.head)
+        return hit_count, (hit_count if hit_total is None else hit_total), records
+
+    def read_hit_total(self, head: bytes) -> int | None:
+        # DBLP sends @total ahead of the hit list, so the first chunk of the response is enough
+        try:
+            for hit_total in ijson.items(io.BytesIO(head), self.total_prefix):
+                return int(hit_total)
+        except (ijson.JSONError, ValueError):
+            pass
+        return None
+
+    def build_record(self, hit_info: dict) -> HitRecord:
+        venue = hit_info.get(api_keys.VENUE)
+        if isinstance(venue, list):
+            venue = ', '.join(venue)
+
+        # len() of a single-author dict counts its keys, matching how scores have always been computed
+        hit_authors = hit_info.get(api_keys.AUTHORS)
+        author_count = len(hit_authors.get(api_keys.AUTHOR, ())) if hit_authors else 0
+
+        return HitRecord(
+            venue=venue,
+            area=self.venue_categorizer.categorize_venue(venue),
+            pages=hit_info.get(api_keys.PAGES, "1"),
+            year=hit_info.get(api_keys.YEAR, 0),
+            author_count=author_count
+        )
+
+
+hit_stream_parser = HitStreamParser(venue_categorizer=categorize_venue)
@@ -0,0 +1,308 @@
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from services.dict_keys import json_keys
+from services.score_tensor import score_tensor_builder
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+class CachedResponse:
+    __slots__ = ("status", "body", "gzip_body", "etag", "gzip_etag")
+
+    def __init__(self, status: int, payload):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body)
+        digest = hashlib.sha1(self.body).hexdigest()
+        # the gzip body is a different representation, so it gets its own validator
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+    def get_representation(self, use_gzip: bool) -> tuple:
+        if use_gzip:
+            return self.gzip_body, self.gzip_etag
+        return self.body, self.etag
+
+
+class ScoreIndex:
+    """
+    In-memory indexes over one final scores file: by institution, by author and by area.
+    """
+    def __init__(self, school_scores: dict, source_path: str, version: int):
+        self.source_path = source_path
+        self.version = version
+        self.institutions = school_scores
+        self.authors = {}
+        for institution, info in school_scores.items():
+            for author, author_info in info.get(json_keys.AUTHORS, {}).items():
+                self.authors.setdefault(author, []).append((institution, author_info))
+
+        self.score_tensor = score_tensor_builder.build(school_scores)
+        self.areas = {}
+        for area in self.score_tensor.areas:
+            self.areas[area] = self.score_tensor.rank(areas=[area])
+
+    def get_author_count(self, institution: str) -> int:
+        info = self.institutions[institution]
+        return info.get(json_keys.AUTHOR_COUNT, len(info.get(json_keys.AUTHORS, {})))
+
+    def rank(self, start_year: int | None, end_year: int | None, areas: list | None) -> list:
+        if start_year is None and end_year is None and areas and len(areas) == 1 and areas[0] in self.areas:
+            return self.areas[areas[0]]
+        return self.score_tensor.rank(start_year=start_year, end_year=end_year, areas=areas)
+
+
+class ScoresRepository:
+    """
+    Holds the index of the newest all-school-scores-final-<date>.json file in a directory.
+    A background thread builds the index for a newer file and swaps it in with a single
+    assignment, so requests never wait on a reload.
+    """
+    FILE_PATTERN = "all-school-scores-final-*.json"
+
+    def __init__(self, directory: str, reload_interval_seconds: float = 5):
+        self.directory = directory
+        self.reload_interval_seconds = reload_interval_seconds
+        self.index = None
+        self.loaded_file = None
+        self.stop_event = threading.Event()
+        self.reload_thread = None
+
+    def find_latest_file(self) -> tuple | None:
+        candidates = []
+        for path in glob.glob(os.path.join(self.directory, self.FILE_PATTERN)):
+            try:
+                candidates.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        if not candidates:
+            return None
+        mtime, path = max(candidates)
+        return path, mtime
+
+    def start(self) -> None:
+        self.reload_if_changed()
+        self.reload_thread = threading.Thread(target=self.watch, name="scores-reloader", daemon=True)
+        self.reload_thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.reload_thread is not None:
+            self.reload_thread.join()
+
+    def watch(self) -> None:
+        while not self.stop_event.wait(self.reload_interval_seconds):
+            self.reload_if_changed()
+
+    def get_index(self) -> ScoreIndex | None:
+        return self.index
+
+    def reload_if_changed(self) -> bool:
+        latest_file = self.find_latest_file()
+        if latest_file is None or latest_file == self.loaded_file:
+            return False
+
+        path, _ = latest_file
+        version = self.index.version + 1 if self.index else 1
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                index = ScoreIndex(json.load(file), path, version)
+        except (IOError, ValueError) as e:
+            logger.error(f"Could not load scores file {path}: {e}")
+            return False
+
+        self.loaded_file = latest_file
+        self.index = index
+        logger.info(f"Loaded scores file: {path} (version {version})")
+        return True
+
+
+class RankingService:
+    def __init__(self, repository: ScoresRepository, cache_size: int = 1024, default_page_size: int = 50,
+                 max_page_size: int = 500):
+        self.repository = repository
+        self.cache = ResponseCache(cache_size)
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.cached_version = 0
+
+    def get_response(self, target: str) -> CachedResponse:
+        index = self.repository.get_index()
+        if index is None:
+            return CachedResponse(503, {"error": "No scores file has been loaded"})
+
+        if index.version != self.cached_version:
+            self.cache.clear()
+            self.cached_version = index.version
+
+        cache_key = (index.version, target)
+        response = self.cache.get(cache_key)
+        if response is None:
+            response = CachedResponse(*self.route(index, target))
+            self.cache.put(cache_key, response)
+        return response
+
+    def route(self, index: ScoreIndex, target: str) -> tuple:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        query = parse_qs(url.query)
+        try:
+            if parts == ["areas"]:
+                return 200, {"areas": index.score_tensor.areas}
+            if parts == ["rankings"]:
+                return 200, self.get_rankings(index, query)
+            if len(parts) == 2 and parts[0] == "institutions":
+                return self.get_institution(index, parts[1])
+            if len(parts) == 2 and parts[0] == "authors":
+                return self.get_author(index, parts[1])
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        return 404, {"error": f"Not found: {url.path}"}
+
+    @staticmethod
+    def get_int_param(query: dict, name: str, default: int | None = None) -> int | None:
+        values = query.get(name)
+        if not values:
+            return default
+        try:
+            return int(values[0])
+        except ValueError:
+            raise ValueError(f"Query parameter '{name}' must be an integer")
+
+    def get_rankings(self, index: ScoreIndex, query: dict) -> dict:
+        page = self.get_int_param(query, "page", 1)
+        per_page = self.get_int_param(query, "per_page", self.default_page_size)
+        if page < 1 or not 1 <= per_page <= self.max_page_size:
+            raise ValueError(f"page must be >= 1 and per_page between 1 and {self.max_page_size}")
+        start_year = self.get_int_param(query, "start_year")
+        end_year = self.get_int_param(query, "end_year")
+        areas = [area for value in query.get("areas", []) for area in value.split(',') if area] or None
+
+        ranking = index.rank(start_year, end_year, areas)
+        offset = (page - 1) * per_page
+        results = [
+            {
+                "rank": offset + i + 1,
+                "institution": institution,
+                json_keys.SCORE: score,
+                json_keys.PAPER_COUNT: paper_count,
+                json_keys.AUTHOR_COUNT: index.get_author_count(institution)
+            }
+            for i, (institution, score, paper_count) in enumerate(ranking[offset:offset + per_page])
+        ]
+        return {"page": page, "per_page": per_page, "total": len(ranking), "results": results}
+
+    @staticmethod
+    def get_institution(index: ScoreIndex, institution: str) -> tuple:
+        if institution not in index.institutions:
+            return 404, {"error": f"Unknown institution: {institution}"}
+        return 200, {"institution": institution, **index.institutions[institution]}
+
+    @staticmethod
+    def get_author(index: ScoreIndex, author: str) -> tuple:
+        if author not in index.authors:
+            return 404, {"error": f"Unknown author: {author}"}
+        affiliations = [{"institution": institution, **author_info} for institution, author_info in index.authors[author]]
+        return 200, {"author": author, "affiliations": affiliations}
+
+
+class RankingRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        response = self.server.ranking_service.get_response(self.path)
+        use_gzip = self.accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        body, etag = response.get_representation(use_gzip)
+
+        if response.status == 200 and self.etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def etag_matches(if_none_match: str, etag: str) -> bool:
+        """
+        Weak comparison of an If-None-Match header against an ETag: "*" matches anything and W/ prefixes are ignored.
+        """
+        tags = [tag.strip() for tag in if_none_match.split(',') if tag.strip()]
+        if "*" in tags:
+            return True
+        return etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+    @staticmethod
+    def accepts_gzip(accept_encoding: str) -> bool:
+        """
+        Returns whether gzip has a non-zero q-value in an Accept-Encoding header, either by name or through "*".
+        """
+        q_values = {}
+        for coding in accept_encoding.split(','):
+            name, *params = [part.strip() for part in coding.split(';')]
+            if not name:
+                continue
+            q_value = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        q_value = float(value)
+                    except ValueError:
+                        q_value = 0.0
+            q_values[name.lower()] = q_value
+        return q_values.get("gzip", q_values.get("*", 0.0)) > 0
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+def create_server(directory: str, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    repository = ScoresRepository(directory)
+    repository.start()
+    server = ThreadingHTTPServer((host, port), RankingRequestHandler)
+    server.ranking_service = RankingService(repository)
+    return server
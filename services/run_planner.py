@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import polars as pl
+
+from services.api_client_service import api_client
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class InstitutionPlan:
+    __slots__ = ("institution", "author_count", "over_one_page_authors", "uncached_authors", "requests", "seconds")
+
+    def __init__(self, institution, author_count, over_one_page_authors, uncached_authors, requests, seconds):
+        self.institution = institution
+        self.author_count = author_count
+        self.over_one_page_authors = over_one_page_authors
+        self.uncached_authors = uncached_authors
+        self.requests = requests
+        self.seconds = seconds
+
+
+class RunPlanner:
+    """
+    Estimates the DBLP requests and time each institution will take. The hit totals cached by
+    previous runs are used to report authors whose search matches more than one page of results.
+    """
+    def __init__(self, api_client, hit_counts_path: str, seconds_per_request: float = 1.5):
+        self.api_client = api_client
+        self.hit_counts_path = hit_counts_path
+        # one request for the DBLP link and one for the publication search
+        self.requests_per_author = 2
+        self.seconds_per_request = seconds_per_request
+
+    def load_hit_counts(self) -> dict:
+        if not os.path.exists(self.hit_counts_path):
+            return {}
+        try:
+            with open(self.hit_counts_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (IOError, ValueError) as e:
+            logger.error(f"Could not read cached hit counts from {self.hit_counts_path}: {e}")
+            return {}
+
+    def exceeds_one_page(self, author: str, hit_counts: dict) -> bool:
+        """
+        Returns whether the author's cached hit total is more than one page of search results. Such authors
+        are still scored from the first page only, so this is reported but adds no requests.
+        """
+        hit_total = hit_counts.get(author)
+        return hit_total is not None and hit_total > self.api_client.max_hits_per_request
+
+    def plan(self, df: pl.DataFrame, affiliations: set, hit_counts: dict) -> list:
+        """
+        Returns an InstitutionPlan per affiliation, ordered by estimated requests, largest first.
+        hit_counts maps authors to the total hits DBLP reported for them in a previous run.
+        """
+        authors_by_affiliation = (
+            df.filter(pl.col('affiliation').is_in(list(affiliations)))
+            .unique(subset=['affiliation', 'scholarid'])
+            .group_by('affiliation')
+            .agg(pl.col('name'))
+        )
+
+        institution_plans = []
+        for institution, authors in authors_by_affiliation.iter_rows():
+            requests = len(authors) * self.requests_per_author
+            over_one_page_authors = sum(1 for author in authors if self.exceeds_one_page(author, hit_counts))
+            uncached_authors = sum(1 for author in authors if author not in hit_counts)
+            institution_plans.append(InstitutionPlan(
+                institution=institution,
+                author_count=len(authors),
+                over_one_page_authors=over_one_page_authors,
+                uncached_authors=uncached_authors,
+                requests=requests,
+                seconds=requests * self.seconds_per_request
+            ))
+
+        institution_plans.sort(key=lambda institution_plan: (-institution_plan.requests, institution_plan.institution))
+        return institution_plans
+
+    @staticmethod
+    def log_plan(institution_plans: list) -> None:
+        total_requests = sum(institution_plan.requests for institution_plan in institution_plans)
+        total_seconds = sum(institution_plan.seconds for institution_plan in institution_plans)
+        logger.info(f"Run plan: {len(institution_plans)} institutions, ~{total_requests} requests, "
+                    f"~{total_seconds / 3600:.1f} hours")
+        for institution_plan in institution_plans:
+            logger.info(
+                f"{institution_plan.institution}: {institution_plan.author_count} authors "
+                f"({institution_plan.over_one_page_authors} with more than one page of hits, "
+                f"{institution_plan.uncached_authors} without cached hit counts), "
+                f"~{institution_plan.requests} requests, ~{institution_plan.seconds / 3600:.2f} hours"
+            )
+
+
+run_planner = RunPlanner(
+    api_client=api_client,
+    hit_counts_path=os.path.join('files', 'author-hit-counts.json')
+)
@@ -2,11 +2,10 @@ from decimal import Decimal
 import logging
 from datetime import datetime
 
-from services.area_conference_mapping import categorize_venue
 from services.page_counter import page_range_counter
 from services.api_client_service import api_client
 from services.dict_keys import json_keys
-from services.api_json_keys import api_keys
+from services.hit_stream_parser import HitRecord
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -66,54 +65,38 @@ class ScoreCalculator:
         author_area_paper_counts[this_hit_area][pub][pub_year][json_keys.SCORE] += this_hit_score
         author_area_paper_counts[this_hit_area][pub][pub_year][json_keys.YEAR_PAPER_COUNT] += 1
 
-    def calculate_score(self, json_data: dict, school_result: dict, author: str):
-        hits = json_data[api_keys.RESULT][api_keys.HITS]
-        hit_key_value = hits.get("hit", [])
+    def calculate_score(self, hit_records: list, school_result: dict, author: str):
         total_score = Decimal(0)
 
-        for hit in hit_key_value:
-            hit_info = hit[api_keys.INFO]
-
-            this_hit_area = self.get_hit_area(hit_info)
-            if not this_hit_area:
-                continue
-
-            page_count = self.get_page_count(hit_info)
+        for hit_record in hit_records:
+            page_count = self.get_page_count(hit_record)
             if not self.is_valid_page_count(page_count):
                 continue
 
-            pub_year = hit_info.get(api_keys.YEAR, 0)
-            this_hit_score = self.calculate_hit_score(hit_info)
+            this_hit_score = self.calculate_hit_score(hit_record)
 
             self.update_dict_scores(
                 result=school_result,
                 author=author,
                 area_scores=json_keys.AREA_SCORES,
-                this_hit_area=this_hit_area,
+                this_hit_area=hit_record.area,
                 this_hit_score=this_hit_score,
-                pub=hit_info.get(api_keys.VENUE),
-                pub_year=pub_year
+                pub=hit_record.venue,
+                pub_year=hit_record.year
             )
             total_score += this_hit_score
             school_result[json_keys.TOTAL_SCORE] += total_score
 
-    def get_hit_area(self, hit_info: dict) -> str:
-        return categorize_venue.categorize_venue(hit_info.get(api_keys.VENUE))
-
-    def get_page_count(self, hit_info: dict) -> int:
-        page_range = hit_info.get(api_keys.PAGES, "1")
-        return page_range_counter.count_pages(page_range)
+    def get_page_count(self, hit_record: HitRecord) -> int:
+        return page_range_counter.count_pages(hit_record.pages)
 
     def is_valid_page_count(self, page_count: int) -> bool:
         return page_count and page_count >= self.api_client.min_page_count
 
-    def calculate_hit_score(self, hit_info: dict) -> Decimal:
+    def calculate_hit_score(self, hit_record: HitRecord) -> Decimal:
         this_hit_score = Decimal(0)
-        hit_authors = hit_info.get(json_keys.AUTHORS, None)
-        if hit_authors:
-            author_list = hit_authors["author"]
-            num_authors = len(author_list)
-            this_hit_score += Decimal(1) / Decimal(num_authors)
+        if hit_record.author_count:
+            this_hit_score += Decimal(1) / Decimal(hit_record.author_count)
         return this_hit_score
 
     def get_author_publication_score(self, author: str, school_result: dict, school: str):
@@ -121,19 +104,34 @@ class ScoreCalculator:
 
         url = self.api_client.generate_author_pub_count_api_url_with_year(author)
 
-        has_less_than_1001_hits, api_call_json = self.api_client.author_has_less_than_1001_hits(url, school, author)
+        has_less_than_1001_hits, hit_records = self.api_client.author_has_less_than_1001_hits(url, school, author)
         if has_less_than_1001_hits:
-            self.calculate_score(api_call_json, school_result, author)
+            self.calculate_score(hit_records, school_result, author)
 
-        elif api_call_json:
-            for year in self.get_year_list():
-                api_url = self.api_client.generate_author_pub_count_api_url_with_year(author, year=year)
-                result = self.api_client.send_get_request(api_url, school, author)
-                self.calculate_score(result, school_result, author)
+        elif hit_records is not None:
+            failed_years = self.score_years(self.get_year_list(), author, school_result, school)
+            # retry only the years that failed; retrying the whole author would count the other years twice
+            for year in self.score_years(failed_years, author, school_result, school):
+                logger.error(f"Could not get {year} publications for {author} at {school}")
 
         elif not has_less_than_1001_hits:
             self.api_client.missed_authors.add(f"{school.replace(' ', '-')} {author.replace(' ', '-')}")
 
+    def score_years(self, years: list, author: str, school_result: dict, school: str) -> list:
+        """
+        Scores the author's publications one year at a time and returns the years whose request failed.
+        """
+        failed_years = []
+        for year in years:
+            api_url = self.api_client.generate_author_pub_count_api_url_with_year(author, year=year)
+            parsed_hits = self.api_client.send_streaming_get_request(api_url, school, author, record_missed=False)
+            if parsed_hits:
+                _, _, year_hit_records = parsed_hits
+                self.calculate_score(year_hit_records, school_result, author)
+            else:
+                failed_years.append(year)
+        return failed_years
+
     @staticmethod
     def get_year_list() -> list:
         start = 1935
@@ -11,6 +11,8 @@ from services.api_client_service import api_client
 from services.score_calculator import score_calc_service
 from services.institution_score_calculator import school_score_calculator
 from services.dict_keys import json_keys
+from services.score_tensor import score_tensor_builder
+from services.run_planner import run_planner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,13 +20,14 @@ logger = logging.getLogger(__name__)
 
 
 class ScoreGenerator:
-    def __init__(self, api_client, score_calculator, institution_score_calculator):
+    def __init__(self, api_client, score_calculator, institution_score_calculator, score_tensor_builder, run_planner):
         self.api_client = api_client
         self.score_calculator = score_calculator
         self.institution_score_calculator = institution_score_calculator
+        self.score_tensor_builder = score_tensor_builder
+        self.run_planner = run_planner
 
-    def generate_all_scores(self):
-        logger.info("Generating scores for all institutions")
+    def load_faculty_list(self) -> tuple:
         file_path = os.path.join('files', 'faculty-list.csv')
         df_cs_rankings = pl.read_csv(file_path)
 
@@ -33,18 +36,46 @@ class ScoreGenerator:
         affiliations_set = {uni for uni in prelim_affiliations_set if finder.search_university(uni)}
         self.clean_data(affiliations_set)
 
-        total_schools = len(affiliations_set)
+        return df_cs_rankings, affiliations_set
+
+    def plan_run(self) -> list:
+        df_cs_rankings, affiliations_set = self.load_faculty_list()
+        hit_counts = self.run_planner.load_hit_counts()
+        institution_plans = self.run_planner.plan(df_cs_rankings, affiliations_set, hit_counts)
+        self.run_planner.log_plan(institution_plans)
+        return institution_plans
+
+    def generate_all_scores(self):
+        logger.info("Generating scores for all institutions")
+        df_cs_rankings, affiliations_set = self.load_faculty_list()
+        self.api_client.hit_counts.update(self.run_planner.load_hit_counts())
+
+        # largest institutions first so the run does not end on one long school
+        institution_plans = self.run_planner.plan(df_cs_rankings, affiliations_set, self.api_client.hit_counts)
+        self.run_planner.log_plan(institution_plans)
+
+        total_schools = len(institution_plans)
+        total_requests = sum(institution_plan.requests for institution_plan in institution_plans)
         processed_schools = 0
+        processed_requests = 0
+        start_time = time.time()
 
         school_scores = {}
-        for school in affiliations_set:
+        for institution_plan in institution_plans:
+            school = institution_plan.institution
             school_score = self.institution_score_calculator.calculate_institution_score(school, df_cs_rankings)
             school_scores[school] = school_score
             self.write_dict_to_file(data=school_scores, file_path="all-school-scores")
+            self.write_dict_to_file(data=self.api_client.hit_counts, file_path=self.run_planner.hit_counts_path)
 
             processed_schools += 1
-            percentage_completed = (processed_schools / total_schools) * 100
-            logger.info(f"Processed {processed_schools} out of {total_schools} schools ({percentage_completed:.2f}%)")
+            processed_requests += institution_plan.requests
+            percentage_completed = (processed_requests / total_requests) * 100
+            elapsed_seconds = time.time() - start_time
+            eta_seconds = elapsed_seconds / processed_requests * (total_requests - processed_requests)
+            logger.info(f"Processed {processed_schools} out of {total_schools} schools "
+                        f"({percentage_completed:.2f}% of estimated requests), "
+                        f"ETA {self.format_time(eta_seconds)} (days:hours:minutes:seconds)")
 
         return school_scores
 
@@ -75,6 +106,12 @@ class ScoreGenerator:
             new_data[school] = new_info
 
         ScoreGenerator.write_dict_to_file(data=new_data, file_path=f"all-school-scores-final-{ScoreGenerator.get_month_day_year()}.json")
+        return new_data
+
+    def write_score_tensor(self, _data):
+        score_tensor = self.score_tensor_builder.build(_data)
+        score_tensor.save(f"score-tensor-{self.get_month_day_year()}")
+        return score_tensor
 
     @staticmethod
     def get_month_day_year():
@@ -108,8 +145,9 @@ class ScoreGenerator:
                     school = school.replace('-', ' ')
                     author = author.replace('-', ' ')
                     url = self.api_client.generate_author_pub_count_api_url_with_year(author)
-                    result = self.api_client.send_get_request(url, school, author)
-                    if result:
+                    parsed_hits = self.api_client.send_streaming_get_request(url, school, author)
+                    if parsed_hits:
+                        _, _, hit_records = parsed_hits
                         if school not in school_scores:
                             logger.info(f"retry_missed_authors added this school: {school}")
                             school_scores[school] = {}
@@ -117,7 +155,7 @@ class ScoreGenerator:
                             logger.info(f"retry_missed_authors added this author: {author}")
                             school_scores[school][json_keys.AUTHORS][author] = {json_keys.PAPER_COUNT: 0, json_keys.AREA_PAPER_COUNTS: {}}
                         logger.info(f"Adding data for missed author: {author} at {school}")
-                        self.score_calculator.calculate_score(result, school_scores[school], author)
+                        self.score_calculator.calculate_score(hit_records, school_scores[school], author)
                         self.api_client.missed_authors.remove(entry)
                 if len(self.api_client.missed_authors) > 0:
                     logger.info(f"Iteration: {iteration} -> missed = {self.api_client.missed_authors}")
@@ -129,5 +167,7 @@ class ScoreGenerator:
 score_generator = ScoreGenerator(
     api_client=api_client,
     score_calculator=score_calc_service,
-    institution_score_calculator=school_score_calculator
+    institution_score_calculator=school_score_calculator,
+    score_tensor_builder=score_tensor_builder,
+    run_planner=run_planner
 )
\ No newline at end of file
@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import numpy as np
+
+from services.area_conference_mapping import categorize_venue
+from services.dict_keys import json_keys
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ScoreTensor:
+    """
+    Institution x area x year scores and paper counts, stored as cumulative sums over the year axis
+    so that any year range is answered with a single subtraction. Papers without a year sit in a slot
+    ahead of the first year and are only counted when no year bounds are given.
+    """
+    SCORES_FILE = "scores.npy"
+    PAPER_COUNTS_FILE = "paper_counts.npy"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, institutions: list, areas: list, years: list, score_cumsum, paper_count_cumsum):
+        self.institutions = institutions
+        self.areas = areas
+        self.years = years
+        self.area_index = {area: i for i, area in enumerate(areas)}
+        # both arrays have shape (institutions, areas, years + 2): a leading zero slice, the unknown year, then years
+        self.score_cumsum = score_cumsum
+        self.paper_count_cumsum = paper_count_cumsum
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, self.SCORES_FILE), self.score_cumsum)
+        np.save(os.path.join(directory, self.PAPER_COUNTS_FILE), self.paper_count_cumsum)
+        with open(os.path.join(directory, self.INDEX_FILE), 'w', encoding='utf-8') as file:
+            json.dump({"institutions": self.institutions, "areas": self.areas, "years": self.years},
+                      file, ensure_ascii=False, indent=4)
+        logger.info(f"Successfully wrote score tensor to: {directory}")
+
+    @classmethod
+    def load(cls, directory: str):
+        with open(os.path.join(directory, cls.INDEX_FILE), 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        score_cumsum = np.load(os.path.join(directory, cls.SCORES_FILE), mmap_mode='r')
+        paper_count_cumsum = np.load(os.path.join(directory, cls.PAPER_COUNTS_FILE), mmap_mode='r')
+        return cls(index["institutions"], index["areas"], index["years"], score_cumsum, paper_count_cumsum)
+
+    def get_year_bounds(self, start_year: int | None, end_year: int | None) -> tuple:
+        last = len(self.years) + 1
+        if start_year is None and end_year is None:
+            return 0, last
+        first_year = self.years[0] if self.years else 0
+        start = 1 if start_year is None else min(max(start_year - first_year + 1, 1), last)
+        end = last if end_year is None else min(max(end_year - first_year + 2, 1), last)
+        return start, max(start, end)
+
+    def get_area_indices(self, areas: list | None) -> list:
+        if areas is None:
+            return list(range(len(self.areas)))
+        unknown_areas = [area for area in areas if area not in self.area_index]
+        if unknown_areas:
+            raise ValueError(f"Unknown areas: {unknown_areas}")
+        return [self.area_index[area] for area in areas]
+
+    def rank(self, start_year: int | None = None, end_year: int | None = None, areas: list | None = None) -> list:
+        """
+        Returns (institution, score, paper_count) tuples sorted by score, highest first, for the
+        inclusive year range and area subset. Missing bounds and areas mean no restriction.
+        """
+        start, end = self.get_year_bounds(start_year, end_year)
+        area_indices = self.get_area_indices(areas)
+
+        scores = self.score_cumsum[:, area_indices, end] - self.score_cumsum[:, area_indices, start]
+        paper_counts = self.paper_count_cumsum[:, area_indices, end] - self.paper_count_cumsum[:, area_indices, start]
+        scores = scores.sum(axis=1)
+        paper_counts = paper_counts.sum(axis=1)
+
+        order = np.argsort(-scores, kind='stable')
+        return [(self.institutions[i], float(scores[i]), int(paper_counts[i])) for i in order]
+
+
+class ScoreTensorBuilder:
+    def __init__(self, venue_categorizer):
+        self.areas = list(venue_categorizer.area_to_conference_map.keys())
+
+    @staticmethod
+    def parse_year(year) -> int | None:
+        try:
+            year = int(year)
+        except (TypeError, ValueError):
+            return None
+        return year if year > 0 else None
+
+    def iter_cells(self, school_scores: dict):
+        """
+        Yields (institution, area, year, score, paper_count) for every author venue/year cell,
+        with year None when it is missing or not a valid year.
+        """
+        for institution, info in school_scores.items():
+            for author_info in info.get(json_keys.AUTHORS, {}).values():
+                for area, venues in author_info.get(json_keys.AREA_PAPER_COUNTS, {}).items():
+                    for venue, years in venues.items():
+                        if venue == json_keys.AREA_ADJUSTED_SCORE:
+                            continue
+                        for year, cell in years.items():
+                            yield institution, area, self.parse_year(year), cell[json_keys.SCORE], cell[json_keys.YEAR_PAPER_COUNT]
+
+    def build(self, school_scores: dict) -> ScoreTensor:
+        logger.info("Building institution x area x year score tensor")
+        institutions = sorted(school_scores.keys())
+        institution_index = {institution: i for i, institution in enumerate(institutions)}
+        areas = list(self.areas)
+        area_index = {area: i for i, area in enumerate(areas)}
+
+        cells = list(self.iter_cells(school_scores))
+        for _, area, _, _, _ in cells:
+            if area not in area_index:
+                area_index[area] = len(areas)
+                areas.append(area)
+
+        cell_years = [year for _, _, year, _, _ in cells if year is not None]
+        years = list(range(min(cell_years), max(cell_years) + 1)) if cell_years else []
+        unknown_year_cells = len(cells) - len(cell_years)
+        if unknown_year_cells:
+            logger.info(f"{unknown_year_cells} cells have no valid year and are only counted in unbounded rankings")
+
+        shape = (len(institutions), len(areas), len(years) + 2)
+        scores = np.zeros(shape, dtype=np.float64)
+        paper_counts = np.zeros(shape, dtype=np.int64)
+        for institution, area, year, score, paper_count in cells:
+            year_slot = 1 if year is None else year - years[0] + 2
+            position = (institution_index[institution], area_index[area], year_slot)
+            scores[position] += float(score)
+            paper_counts[position] += paper_count
+
+        np.cumsum(scores, axis=2, out=scores)
+        np.cumsum(paper_counts, axis=2, out=paper_counts)
+
+        return ScoreTensor(institutions, areas, years, scores, paper_counts)
+
+
+score_tensor_builder = ScoreTensorBuilder(venue_categorizer=categorize_venue)
@@ -0,0 +1,54 @@
+import io
+import json
+
+from services.hit_stream_parser import hit_stream_parser
+
+
+def make_stream(hits: dict) -> io.BytesIO:
+    return io.BytesIO(json.dumps({"result": {"query": "author", "hits": hits}}).encode('utf-8'))
+
+
+def test_parse_keeps_scoring_fields_of_area_hits():
+    stream = make_stream({
+        "@total": "2345",
+        "@sent": "4",
+        "hit": [
+            {"info": {"authors": {"author": [{"@pid": "1", "text": "A"}, {"@pid": "2", "text": "B"},
+                                             {"@pid": "3", "text": "C"}]},
+                      "venue": "ISCA", "pages": "1-14", "year": "2019"}},
+            {"info": {"authors": {"author": {"@pid": "1", "text": "A"}}, "venue": "SIGMOD Conference",
+                      "pages": "5-20", "year": "2020"}},
+            {"info": {"authors": {"author": [{"@pid": "1", "text": "A"}]}, "venue": ["ISCA"]}},
+            {"info": {"authors": {"author": [{"@pid": "1", "text": "A"}]}, "venue": "Nature", "year": "2021"}},
+        ]
+    })
+
+    hit_count, hit_total, records = hit_stream_parser.parse(stream)
+
+    assert hit_count == 4
+    assert hit_total == 2345
+    assert [(r.venue, r.area, r.pages, r.year, r.author_count) for r in records] == [
+        ("ISCA", "computer_architecture", "1-14", "2019", 3),
+        # a single author is decoded as a dict, and len() of it counts its two keys
+        ("SIGMOD Conference", "databases", "5-20", "2020", 2),
+        # list venues are joined, and missing pages and year get the defaults
+        ("ISCA", "computer_architecture", "1", 0, 1),
+    ]
+
+
+def test_parse_falls_back_to_hit_count_without_total():
+    stream = make_stream({"hit": [{"info": {"venue": "Nature"}}, {"info": {"venue": "OSDI"}}]})
+
+    hit_count, hit_total, records = hit_stream_parser.parse(stream)
+
+    assert hit_count == 2
+    assert hit_total == 2
+    assert [(r.area, r.author_count) for r in records] == [("operating_systems", 0)]
+
+
+def test_parse_without_hits():
+    hit_count, hit_total, records = hit_stream_parser.parse(make_stream({"@total": "0"}))
+
+    assert hit_count == 0
+    assert hit_total == 0
+    assert records == []
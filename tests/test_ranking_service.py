@@ -0,0 +1,252 @@
+import gzip
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from services.ranking_service import RankingRequestHandler, RankingService, ScoresRepository, create_server
+
+
+SCHOOL_SCORES = {
+    "A University": {
+        "total_score": 1.5,
+        "author_count": 1,
+        "authors": {
+            "Author A": {
+                "dblp_link": "https://dblp.org/pid/a",
+                "paper_count": 2,
+                "area_paper_counts": {
+                    "databases": {
+                        "area_adjusted_score": 1.5,
+                        "SIGMOD": {"2019": {"score": 0.5, "year_paper_count": 1},
+                                   "2021": {"score": 1, "year_paper_count": 1}}
+                    }
+                }
+            }
+        }
+    },
+    "B University": {
+        "total_score": 2,
+        "author_count": 1,
+        "authors": {
+            "Author B": {
+                "dblp_link": "https://dblp.org/pid/b",
+                "paper_count": 2,
+                "area_paper_counts": {
+                    "operating_systems": {
+                        "area_adjusted_score": 2,
+                        "SOSP": {"2020": {"score": 2, "year_paper_count": 2}}
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+def write_scores(directory, name: str, school_scores: dict, mtime: float) -> str:
+    path = os.path.join(directory, f"all-school-scores-final-{name}.json")
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(school_scores, file)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def scores_directory(tmp_path):
+    write_scores(tmp_path, "May-01-2024", SCHOOL_SCORES, mtime=1_700_000_000)
+    return tmp_path
+
+
+@pytest.fixture
+def ranking_service(scores_directory) -> RankingService:
+    repository = ScoresRepository(str(scores_directory))
+    repository.reload_if_changed()
+    return RankingService(repository, default_page_size=5, max_page_size=10)
+
+
+def get_json(ranking_service: RankingService, target: str) -> tuple:
+    response = ranking_service.get_response(target)
+    return response.status, json.loads(response.body)
+
+
+def test_rankings_paginate(ranking_service):
+    status, payload = get_json(ranking_service, "/rankings?per_page=1&page=2")
+
+    assert status == 200
+    assert payload["total"] == 2
+    assert payload["results"] == [
+        {"rank": 2, "institution": "A University", "score": 1.5, "paper_count": 2, "author_count": 1}
+    ]
+
+
+def test_rankings_page_past_the_end_is_empty(ranking_service):
+    status, payload = get_json(ranking_service, "/rankings?per_page=10&page=5")
+
+    assert status == 200
+    assert payload["results"] == []
+
+
+@pytest.mark.parametrize("query", ["page=0", "per_page=0", "per_page=11", "page=x", "start_year=soon"])
+def test_rankings_bad_parameters_return_400(ranking_service, query):
+    status, payload = get_json(ranking_service, f"/rankings?{query}")
+
+    assert status == 400
+    assert "error" in payload
+
+
+def test_rankings_filter_by_year_and_area(ranking_service):
+    status, payload = get_json(ranking_service, "/rankings?areas=databases&start_year=2020")
+
+    assert status == 200
+    assert [(r["institution"], r["score"]) for r in payload["results"]] == [("A University", 1.0), ("B University", 0.0)]
+
+
+def test_unknown_area_returns_400(ranking_service):
+    status, payload = get_json(ranking_service, "/rankings?areas=astrology")
+
+    assert status == 400
+    assert "astrology" in payload["error"]
+
+
+def test_institution_and_author_detail(ranking_service):
+    status, payload = get_json(ranking_service, "/institutions/A%20University")
+    assert status == 200
+    assert payload["institution"] == "A University"
+    assert payload["total_score"] == 1.5
+
+    status, payload = get_json(ranking_service, "/authors/Author%20B")
+    assert status == 200
+    assert [affiliation["institution"] for affiliation in payload["affiliations"]] == ["B University"]
+
+
+@pytest.mark.parametrize("target", ["/institutions/Nowhere%20University", "/authors/Nobody", "/nothing/here"])
+def test_unknown_resources_return_404(ranking_service, target):
+    status, payload = get_json(ranking_service, target)
+
+    assert status == 404
+    assert "error" in payload
+
+
+def test_no_scores_file_returns_503(tmp_path):
+    ranking_service = RankingService(ScoresRepository(str(tmp_path)))
+
+    assert ranking_service.get_response("/rankings").status == 503
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("gzip;q=0.5, br", True),
+    ("GZIP", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0", False),
+    ("identity, *;q=0", False),
+    ("*;q=1, gzip;q=0", False),
+    ("br", False),
+    ("", False),
+])
+def test_accepts_gzip(accept_encoding, expected):
+    assert RankingRequestHandler.accepts_gzip(accept_encoding) is expected
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ('*', True),
+    ('"xyz"', False),
+    ('', False),
+])
+def test_etag_matches(if_none_match, expected):
+    assert RankingRequestHandler.etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_reload_picks_up_newer_file(scores_directory):
+    repository = ScoresRepository(str(scores_directory))
+    assert repository.reload_if_changed()
+    assert repository.get_index().version == 1
+    assert not repository.reload_if_changed()
+
+    newer_scores = {"C University": {"total_score": 0, "authors": {}}}
+    newer_path = write_scores(scores_directory, "June-01-2024", newer_scores, mtime=1_700_000_100)
+
+    assert repository.reload_if_changed()
+    assert repository.get_index().source_path == newer_path
+    assert repository.get_index().version == 2
+    assert list(repository.get_index().institutions) == ["C University"]
+
+
+def test_reload_skips_half_written_file(scores_directory):
+    repository = ScoresRepository(str(scores_directory))
+    repository.reload_if_changed()
+    loaded_index = repository.get_index()
+
+    newer_path = os.path.join(scores_directory, "all-school-scores-final-June-01-2024.json")
+    with open(newer_path, 'w', encoding='utf-8') as file:
+        file.write(json.dumps(SCHOOL_SCORES)[:40])
+
+    assert not repository.reload_if_changed()
+    assert repository.get_index() is loaded_index
+
+    # once the write finishes the same file is loaded on the next check
+    with open(newer_path, 'w', encoding='utf-8') as file:
+        json.dump(SCHOOL_SCORES, file)
+    os.utime(newer_path, (1_700_000_100, 1_700_000_100))
+
+    assert repository.reload_if_changed()
+    assert repository.get_index().source_path == newer_path
+
+
+@pytest.fixture
+def server_connection(scores_directory):
+    server = create_server(str(scores_directory), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = http.client.HTTPConnection(*server.server_address)
+    yield connection
+    connection.close()
+    server.shutdown()
+    server.ranking_service.repository.stop()
+    server.server_close()
+
+
+def request(connection, headers=None):
+    connection.request("GET", "/areas", headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def test_server_returns_304_for_matching_etag(server_connection):
+    response, _ = request(server_connection)
+    etag = response.getheader("ETag")
+    assert response.status == 200
+
+    for if_none_match in (etag, f"W/{etag}", "*"):
+        response, body = request(server_connection, {"If-None-Match": if_none_match})
+        assert response.status == 304
+        assert body == b""
+        assert response.getheader("ETag") == etag
+        assert response.getheader("Vary") == "Accept-Encoding"
+
+    response, _ = request(server_connection, {"If-None-Match": '"stale"'})
+    assert response.status == 200
+
+
+def test_server_gzip_has_its_own_etag(server_connection):
+    plain_response, plain_body = request(server_connection)
+    gzip_response, gzip_body = request(server_connection, {"Accept-Encoding": "gzip"})
+    refused_response, refused_body = request(server_connection, {"Accept-Encoding": "gzip;q=0"})
+
+    assert gzip_response.getheader("Content-Encoding") == "gzip"
+    assert gzip.decompress(gzip_body) == plain_body
+    assert gzip_response.getheader("ETag") != plain_response.getheader("ETag")
+    assert refused_response.getheader("Content-Encoding") is None
+    assert refused_body == plain_body
+
+    response, _ = request(server_connection, {"Accept-Encoding": "gzip",
+                                              "If-None-Match": plain_response.getheader("ETag")})
+    assert response.status == 200
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from services.score_tensor import ScoreTensor, score_tensor_builder
+
+
+def make_cell(score, year_paper_count) -> dict:
+    return {"score": score, "year_paper_count": year_paper_count}
+
+
+SCHOOL_SCORES = {
+    "A University": {
+        "authors": {
+            "Author A": {
+                "area_paper_counts": {
+                    "databases": {
+                        "area_adjusted_score": 2.5,
+                        # year 0 is what the scorer records when DBLP leaves out the year
+                        "SIGMOD": {"2019": make_cell(0.5, 1), "2021": make_cell(1, 1), "0": make_cell(1, 1)}
+                    },
+                    "operating_systems": {
+                        "area_adjusted_score": 0.25,
+                        "OSDI": {"2020": make_cell(0.25, 1)}
+                    }
+                }
+            }
+        }
+    },
+    "B University": {
+        "authors": {
+            "Author B": {
+                "area_paper_counts": {
+                    "operating_systems": {"area_adjusted_score": 2, "SOSP": {"2020": make_cell(2, 2)}}
+                }
+            }
+        }
+    },
+    "C University": {"authors": {}}
+}
+
+
+@pytest.fixture
+def score_tensor() -> ScoreTensor:
+    return score_tensor_builder.build(SCHOOL_SCORES)
+
+
+def test_unbounded_rank_counts_unknown_year_cells(score_tensor):
+    assert score_tensor.years == [2019, 2020, 2021]
+    assert score_tensor.rank() == [("A University", 2.75, 4), ("B University", 2.0, 2), ("C University", 0.0, 0)]
+
+
+def test_rank_single_year(score_tensor):
+    assert score_tensor.rank(2020, 2020) == [
+        ("B University", 2.0, 2), ("A University", 0.25, 1), ("C University", 0.0, 0)
+    ]
+    assert score_tensor.rank(2019, 2019) == [
+        ("A University", 0.5, 1), ("B University", 0.0, 0), ("C University", 0.0, 0)
+    ]
+
+
+def test_rank_open_ended_ranges_exclude_unknown_year(score_tensor):
+    assert score_tensor.rank(start_year=2021) == [
+        ("A University", 1.0, 1), ("B University", 0.0, 0), ("C University", 0.0, 0)
+    ]
+    assert score_tensor.rank(end_year=2019) == [
+        ("A University", 0.5, 1), ("B University", 0.0, 0), ("C University", 0.0, 0)
+    ]
+    assert score_tensor.rank(start_year=1900) == [
+        ("B University", 2.0, 2), ("A University", 1.75, 3), ("C University", 0.0, 0)
+    ]
+
+
+@pytest.mark.parametrize("start_year, end_year", [(1990, 2000), (2030, 2040), (2021, 2019)])
+def test_rank_outside_data_is_empty(score_tensor, start_year, end_year):
+    assert score_tensor.rank(start_year, end_year) == [
+        ("A University", 0.0, 0), ("B University", 0.0, 0), ("C University", 0.0, 0)
+    ]
+
+
+def test_rank_with_only_unknown_years():
+    score_tensor = score_tensor_builder.build({
+        "A University": {
+            "authors": {"Author A": {"area_paper_counts": {"databases": {"SIGMOD": {"0": make_cell(1, 1)}}}}}
+        }
+    })
+
+    assert score_tensor.years == []
+    assert score_tensor.rank() == [("A University", 1.0, 1)]
+    assert score_tensor.rank(2000, 2020) == [("A University", 0.0, 0)]
+
+
+def test_rank_without_institutions():
+    score_tensor = score_tensor_builder.build({})
+
+    assert score_tensor.rank() == []
+    assert score_tensor.rank(2000, 2020) == []
+
+
+def test_rank_area_subset(score_tensor):
+    assert score_tensor.rank(areas=["databases"]) == [
+        ("A University", 2.5, 3), ("B University", 0.0, 0), ("C University", 0.0, 0)
+    ]
+    assert score_tensor.rank(2020, 2021, areas=["databases", "operating_systems"]) == [
+        ("B University", 2.0, 2), ("A University", 1.25, 2), ("C University", 0.0, 0)
+    ]
+
+
+def test_rank_unknown_area_raises(score_tensor):
+    with pytest.raises(ValueError):
+        score_tensor.rank(areas=["databases", "astrology"])
+
+
+def test_save_and_load_round_trip(score_tensor, tmp_path):
+    score_tensor.save(str(tmp_path))
+
+    loaded = ScoreTensor.load(str(tmp_path))
+
+    assert isinstance(loaded.score_cumsum, np.memmap)
+    assert isinstance(loaded.paper_count_cumsum, np.memmap)
+    assert loaded.institutions == score_tensor.institutions
+    assert loaded.areas == score_tensor.areas
+    assert loaded.years == score_tensor.years
+    assert loaded.rank() == score_tensor.rank()
+    assert loaded.rank(2020, 2021, areas=["operating_systems"]) == score_tensor.rank(2020, 2021, areas=["operating_systems"])